@@ -18,6 +18,8 @@ from fastapi.responses import HTMLResponse, Response
 from ansari_whatsapp.services.whatsapp_conversation_manager import WhatsAppConversationManager
 from ansari_whatsapp.services.service_provider import get_ansari_client
 from ansari_whatsapp.services.ansari_client_real import AnsariClientReal
+from ansari_whatsapp.services.meta_service_provider import get_meta_api_service
+from ansari_whatsapp.services.meta_api_service_real import MetaApiServiceReal
 from ansari_whatsapp.utils.whatsapp_webhook_utils import (
     parse_meta_payload,
     verify_meta_signature,
@@ -43,11 +45,11 @@ async def lifespan(app: FastAPI):
     HTTP connection pools when the application starts and shuts down.
 
     Startup:
-    - Gets the singleton Ansari client instance (created on first access)
-    - This ensures the client is initialized before any requests arrive
+    - Gets the singleton Ansari client and Meta API service instances (created on first access)
+    - This ensures the clients are initialized before any requests arrive
 
     Shutdown:
-    - Closes the singleton Ansari client to release connection pools
+    - Closes the singleton Ansari client and Meta API service to release connection pools
     - Since get_ansari_client() returns a singleton, this closes the SAME instance
       used by all request handlers throughout the application lifecycle
     - Clean up any background tasks or resources
@@ -60,6 +62,8 @@ async def lifespan(app: FastAPI):
     # Get singleton client instance - this will be shared across all requests
     client = get_ansari_client()
     logger.info(f"Ansari client singleton initialized: {type(client).__name__}")
+    meta_api_service = get_meta_api_service()
+    logger.info(f"Meta API service singleton initialized: {type(meta_api_service).__name__}")
 
     yield  # Application is running
 
@@ -68,6 +72,9 @@ async def lifespan(app: FastAPI):
     if isinstance(client, AnsariClientReal):
         await client.close()
         logger.info("HTTP client connections closed successfully")
+    if isinstance(meta_api_service, MetaApiServiceReal):
+        await meta_api_service.close()
+        logger.info("Meta API HTTP client connections closed successfully")
 
 
 # Create FastAPI application with lifespan management
@@ -191,23 +198,15 @@ async def main_webhook(
           are available for each environment.
     """
     # Step 1: Signature verification now handled by Depends(verify_meta_signature_dependency)
-    # Step 2: Parse the JSON payload
-    data = await request.json()
+    # Step 2: Get the raw payload (already read, and cached by Starlette, when verifying the signature)
+    body_bytes = await request.body()
 
-    # Step 3: Extract message details from the webhook payload
+    # Step 3: Parse the JSON payload and extract message details from it
     try:
-        (
-            is_status,
-            is_target_business_number,
-            from_whatsapp_number,
-            incoming_msg_type,
-            incoming_msg_body,
-            message_id,
-            message_unix_time,
-        ) = await parse_meta_payload(data)
+        parsed_webhook = await parse_meta_payload(body_bytes)
 
         # Check if this webhook is intended for our WhatsApp business phone number
-        if not is_target_business_number:
+        if not parsed_webhook.is_target_business_number:
             logger.debug("Ignoring webhook not intended for our WhatsApp business number")
             return create_response_for_meta(
                 success=True,
@@ -216,7 +215,7 @@ async def main_webhook(
             )
 
         # Terminate if the incoming message is a status message (e.g., "delivered")
-        if is_status:
+        if parsed_webhook.is_status:
             logger.debug("Ignoring status update message (e.g., delivered, read)")
             # This is a status message, not a user message, so doesn't need processing
             return create_response_for_meta(
@@ -225,7 +224,7 @@ async def main_webhook(
                 error_code="STATUS_MESSAGE"
             )
 
-        logger.debug(f"Incoming whatsapp webhook message from {from_whatsapp_number}")
+        logger.debug(f"Incoming whatsapp webhook message from {parsed_webhook.user_whatsapp_number}")
     except Exception as e:
         logger.exception(f"Error extracting message details: {e}")
         return create_response_for_meta(
@@ -238,11 +237,11 @@ async def main_webhook(
 
     # Create a user-specific conversation manager instance for this request
     conversation_manager = WhatsAppConversationManager(
-        user_phone_num=from_whatsapp_number,
-        incoming_msg_type=incoming_msg_type,
-        incoming_msg_body=incoming_msg_body,
-        message_id=message_id,
-        message_unix_time=message_unix_time,
+        user_phone_num=parsed_webhook.user_whatsapp_number,
+        incoming_msg_type=parsed_webhook.incoming_msg_type,
+        incoming_msg_body=parsed_webhook.incoming_msg_body,
+        message_id=parsed_webhook.message_id,
+        message_unix_time=parsed_webhook.message_unix_time,
     )
 
     # Check if the WhatsApp service is enabled
@@ -266,7 +265,7 @@ async def main_webhook(
     #   and not for the staging server.
     #   This is done by prefixing the message with "!d " (e.g., "!d what is ansari?")
     # NOTE: Obviously, this temp. solution will be removed when we get a dedicated testing number for staging testing.
-    if get_settings().DEPLOYMENT_TYPE == "staging" and incoming_msg_body.get("body", "").startswith("!d "):
+    if get_settings().DEPLOYMENT_TYPE == "staging" and parsed_webhook.incoming_msg_body.get("body", "").startswith("!d "):
         logger.debug("Incoming message is meant for a dev who's testing locally now, so will not process it in staging...")
         return create_response_for_meta(
             success=False,
@@ -282,7 +281,7 @@ async def main_webhook(
 
     # Check if there are more than xx hours have passed from the user's message to the current time
     # If so, send a message to the user and return
-    if is_message_too_old(message_unix_time):
+    if is_message_too_old(parsed_webhook.message_unix_time):
         return create_response_for_meta(
             success=False,
             message="Message too old, notified user",
@@ -305,7 +304,7 @@ async def main_webhook(
         )
 
     # Check if the incoming message is a media type other than text
-    if incoming_msg_type != "text":
+    if parsed_webhook.incoming_msg_type != "text":
         background_tasks.add_task(
             conversation_manager.handle_unsupported_message,
         )
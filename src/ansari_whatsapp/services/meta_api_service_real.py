@@ -10,24 +10,45 @@ from ansari_whatsapp.services.meta_api_service_base import MetaApiServiceBase
 
 
 class MetaApiServiceReal(MetaApiServiceBase):
-    """Real Meta WhatsApp API service that makes actual HTTP requests."""
+    """Real Meta WhatsApp API service that makes actual HTTP requests.
+
+    Uses a persistent HTTP/2 httpx.AsyncClient, so all requests to Meta's Graph API
+    share one pooled connection (multiplexed streams + HPACK header compression).
+    References:
+    - https://www.python-httpx.org/http2/
+    - https://www.python-httpx.org/advanced/clients/#why-use-a-client
+    """
 
     def __init__(self):
-        """Initialize Meta API service with settings."""
+        """Initialize Meta API service with a persistent HTTP/2 client and authentication.
+
+        References:
+        - https://www.python-httpx.org/http2/
+        - https://www.python-httpx.org/advanced/resource-limits/
+        """
         settings = get_settings()
         self.api_url = settings.META_API_URL
         self.access_token = settings.META_ACCESS_TOKEN_FROM_SYS_USER.get_secret_value()
 
-    def _get_headers(self) -> dict:
-        """Get HTTP headers for Meta API requests.
-
-        Returns:
-            dict: Headers with authorization and content-type
+        # Create persistent HTTP/2 client with authentication headers
+        # All requests will automatically include these headers
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            },
+            timeout=30.0,  # Default timeout for all requests
+        )
+
+    async def close(self):
+        """Close the HTTP client connection and release resources.
+
+        References:
+        - https://www.python-httpx.org/async/#opening-and-closing-clients
         """
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        await self.client.aclose()
 
     async def send_typing_indicator(
         self,
@@ -56,16 +77,12 @@ class MetaApiServiceReal(MetaApiServiceBase):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                logger.debug(f"Sending typing indicator to {recipient_phone}")
-
-                response = await client.post(
-                    self.api_url,
-                    headers=self._get_headers(),
-                    json=json_data
-                )
-                response.raise_for_status()
-                logger.info("Typing indicator sent successfully")
+            logger.debug(f"Sending typing indicator to {recipient_phone}")
+
+            # Note: self.client already has auth headers and default timeout configured
+            response = await self.client.post(self.api_url, json=json_data)
+            response.raise_for_status()
+            logger.info("Typing indicator sent successfully")
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error sending typing indicator: {e.response.status_code}")
@@ -102,33 +119,29 @@ class MetaApiServiceReal(MetaApiServiceBase):
             return
 
         try:
-            async with httpx.AsyncClient() as client:
-                logger.debug(f"Sending {len(message_parts)} message part(s) to {recipient_phone}")
-
-                for i, part in enumerate(message_parts, 1):
-                    json_data = {
-                        "messaging_product": "whatsapp",
-                        "to": recipient_phone,
-                        "text": {"body": part},
-                    }
-
-                    response = await client.post(
-                        self.api_url,
-                        headers=self._get_headers(),
-                        json=json_data
+            logger.debug(f"Sending {len(message_parts)} message part(s) to {recipient_phone}")
+
+            # NOTE: Parts are sent sequentially (not concurrently) so that they arrive in order
+            for i, part in enumerate(message_parts, 1):
+                json_data = {
+                    "messaging_product": "whatsapp",
+                    "to": recipient_phone,
+                    "text": {"body": part},
+                }
+
+                response = await self.client.post(self.api_url, json=json_data)
+                response.raise_for_status()
+
+                # Log message part
+                if part != "...":
+                    preview = part[:100] + ('...' if len(part) > 100 else '')
+                    logger.info(
+                        f"Sent message part {i}/{len(message_parts)}: {preview}"
                     )
-                    response.raise_for_status()
-
-                    # Log message part
-                    if part != "...":
-                        preview = part[:100] + ('...' if len(part) > 100 else '')
-                        logger.info(
-                            f"Sent message part {i}/{len(message_parts)}: {preview}"
-                        )
-                    else:
-                        logger.info("Sent typing indicator")
-
-                logger.info(f"All {len(message_parts)} message part(s) sent successfully")
+                else:
+                    logger.info("Sent typing indicator")
+
+            logger.info(f"All {len(message_parts)} message part(s) sent successfully")
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error sending message: {e.response.status_code}")
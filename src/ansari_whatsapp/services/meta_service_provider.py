@@ -1,6 +1,7 @@
 # Service Provider for Meta WhatsApp API services
 """Factory function for providing the appropriate Meta API service implementation."""
 
+from typing import Optional
 from loguru import logger
 
 from ansari_whatsapp.utils.config import get_settings
@@ -9,27 +10,54 @@ from ansari_whatsapp.services.meta_api_service_real import MetaApiServiceReal
 from ansari_whatsapp.services.meta_api_service_mock import MetaApiServiceMock
 
 
+# Singleton instance - shared across the entire application
+_meta_api_service_instance: Optional[MetaApiServiceBase] = None
+
+
 def get_meta_api_service() -> MetaApiServiceBase:
-    """Factory function that returns the appropriate Meta API service based on configuration.
+    """Factory function that returns THE SAME Meta API service instance (singleton).
 
-    This function implements the Service Provider pattern, returning either:
+    This function implements the Singleton Service Provider pattern, returning either:
     - MetaApiServiceReal: Makes actual HTTP calls to Meta WhatsApp API (production)
     - MetaApiServiceMock: Simulates API responses without network calls (development/testing)
 
-    The choice is controlled by the MOCK_META_API environment variable.
+    Sharing one instance means all requests to Meta reuse a single HTTP/2 connection pool.
+
+    The choice is controlled by the MOCK_META_API environment variable, evaluated
+    only on first call (subsequent calls return the existing instance).
 
     Returns:
-        MetaApiServiceBase: Either MetaApiServiceReal or MetaApiServiceMock instance
+        MetaApiServiceBase: The singleton instance (MetaApiServiceReal or MetaApiServiceMock)
 
     Example:
         >>> meta_service = get_meta_api_service()
         >>> await meta_service.send_message("+1234567890", ["Hello World"])
+
+    Note:
+        For test isolation, use reset_meta_api_service() to clear the singleton between tests.
+    """
+    global _meta_api_service_instance
+
+    if _meta_api_service_instance is None:
+        settings = get_settings()
+
+        if settings.MOCK_META_API:
+            logger.info("Service Provider: Creating MetaApiServiceMock singleton (mock mode enabled)")
+            _meta_api_service_instance = MetaApiServiceMock()
+        else:
+            logger.debug("Service Provider: Creating MetaApiServiceReal singleton (production mode)")
+            _meta_api_service_instance = MetaApiServiceReal()
+
+    return _meta_api_service_instance
+
+
+def reset_meta_api_service() -> None:
+    """Reset the Meta API service singleton instance.
+
+    This function clears the singleton instance, allowing a fresh service to be created
+    on the next call to get_meta_api_service(). Like reset_ansari_client(), it's intended
+    only for test fixtures to ensure proper test isolation.
     """
-    settings = get_settings()
-
-    if settings.MOCK_META_API:
-        logger.info("Service Provider: Returning MetaApiServiceMock (mock mode enabled)")
-        return MetaApiServiceMock()
-    else:
-        logger.debug("Service Provider: Returning MetaApiServiceReal (production mode)")
-        return MetaApiServiceReal()
+    global _meta_api_service_instance
+    _meta_api_service_instance = None
+    logger.debug("Service Provider: Meta API service singleton reset")
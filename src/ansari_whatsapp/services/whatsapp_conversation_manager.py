@@ -103,6 +103,13 @@ class WhatsAppConversationManager:
             logger.error(f"Error in typing indicator loop: {e}")
             logger.exception(e)
 
+    def _cancel_typing_task(self) -> None:
+        """Cancel the typing indicator task if it's still running."""
+        task = self.typing_indicator_task
+        if task and not task.done():
+            logger.debug("Canceling typing indicator task")
+            task.cancel()
+
     async def check_and_register_user(self) -> bool:
         """Check if the user's phone number is stored and register if not.
 
@@ -251,15 +258,10 @@ class WhatsAppConversationManager:
                 await self.send_whatsapp_message(
                     "An error occurred while processing your message. Please try again later."
                 )
-                # Cancel typing indicator if running
-                if self.typing_indicator_task and not self.typing_indicator_task.done():
-                    self.typing_indicator_task.cancel()
                 return
 
-            # Cancel the typing indicator task if it's still running
-            if self.typing_indicator_task and not self.typing_indicator_task.done():
-                logger.debug("Canceling typing indicator task as message processing is complete")
-                self.typing_indicator_task.cancel()
+            # Stop the typing indicator before sending the response, as message processing is complete
+            self._cancel_typing_task()
 
             if not response:
                 logger.warning("Received an empty response from the backend")
@@ -287,9 +289,10 @@ class WhatsAppConversationManager:
             await self.send_whatsapp_message(
                 "An unexpected error occurred while processing your message. Please try again later.",
             )
-            # Cancel typing indicator if running
-            if self.typing_indicator_task and not self.typing_indicator_task.done():
-                self.typing_indicator_task.cancel()
+        finally:
+            # Make sure the typing indicator never outlives the handling of this message
+            # (including early returns and task cancellation)
+            self._cancel_typing_task()
 
     async def handle_unsupported_message(self) -> None:
         """Handle an incoming unsupported message by sending an appropriate response."""
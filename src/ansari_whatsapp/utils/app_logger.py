@@ -17,18 +17,40 @@ Technical Details:
   will modify the global logging state.
 """
 
-import json
+import atexit
+import io
 import os
 import sys
+import threading
+import time
 
+import orjson
 from loguru import logger
 
 from ansari_whatsapp.utils.config import get_settings
 
 ########################################## Global Vars and Logger Configurations ##########################################
 
-# Create logs directory if it doesn't exist
-os.makedirs("logs", exist_ok=True)
+# Log file used when running locally (computed once, see "Main Code" below)
+# NOTE: There's no need to create the "logs" directory ourselves, as loguru's file sink creates it if it doesn't exist
+#   Source: https://github.com/Delgan/loguru/blob/master/loguru/_file_sink.py (see `_create_dirs()`)
+LOG_DIR = os.path.join(os.getcwd(), "logs")
+ALL_LOGS_FILE = os.path.join(LOG_DIR, "all_logs.log")
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+# Log formats for local development (console and file)
+# NOTE: Loguru parses the color tags (e.g., "<green>") only once, when a handler is added (it precomputes the colored
+#   format of each level), so there's no per-record cost to using them (unlike hardcoded ANSI codes,
+#   they also give each level its own color through the `<level>` tag).
+#   Source: https://github.com/Delgan/loguru/blob/master/loguru/_handler.py (see `Handler.__init__()`)
+CONSOLE_LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <4}</level> | "
+    "<cyan>{file}</cyan>:<cyan>{line}</cyan> "
+    "<blue>[{function}()]</blue> | "
+    "<level>{message}</level>"
+)
+FILE_LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {file}:{line} [{function}()] | {message}"
 
 # Remove any pre-existing default handlers made by loguru
 logger.remove()
@@ -40,22 +62,32 @@ settings = get_settings()
 # CloudWatch Logs Insights works best with JSON-formatted logs
 is_aws_deployment = settings.DEPLOYMENT_TYPE not in ["local", "development"] and os.getenv("GITHUB_ACTIONS") != "true"
 
+# Buffered writer used by `cloudwatch_json_sink` (only created in AWS deployments, see "Main Code" below)
+# Buffering log records and flushing them periodically means one write() syscall per batch of records,
+# instead of one per record.
+STDERR_BUFFER_SIZE = 64 * 1024
+STDERR_FLUSH_INTERVAL_SECONDS = 0.2
+stderr_buffer: io.BufferedWriter | None = None
+ERROR_LEVEL_NO = logger.level("ERROR").no
+
+# NOTE: When LOG_TEST_FILES_ONLY is False (i.e., usually), we don't pass any filter to loguru's handlers at all,
+#   so that no filter function gets called for each log record
+LOG_TEST_FILES_ONLY = settings.LOG_TEST_FILES_ONLY
+
+# IDs of the handlers added by `configure_logger()`
+handler_ids: list[int] = []
+
 ########################################## Functions ##########################################
 
-# Filter for test files only (when LOG_TEST_FILES_ONLY is True)
+# Filter for test files only (only used when LOG_TEST_FILES_ONLY is True)
 def log_filter(record):
-    """Filter logs based on test file settings.
+    """Only allow logs from files in "tests" folder or files starting with "test_".
 
     Args:
         record: The log record being processed.
     """
-    # If LOG_TEST_FILES_ONLY is True, only allow logs from files in "tests" folder or files starting with "test_"
-    if settings.LOG_TEST_FILES_ONLY and not (
-        "tests" in record["file"].path or "test_" in record["file"].name
-    ):
-        return False
-
-    return True
+    record_file = record["file"]
+    return "tests" in record_file.path or record_file.name.startswith("test_")
 
 # Custom sink function for AWS CloudWatch JSON formatting
 def cloudwatch_json_sink(message):
@@ -63,6 +95,11 @@ def cloudwatch_json_sink(message):
 
     Extracts the record from the message and formats it as minimal JSON.
 
+    NOTE: We don't use loguru's `serialize=True` instead, as it always serializes with the stdlib `json` module
+    (with no option to plug in orjson), and it emits a much bigger payload (e.g., the formatted text,
+    elapsed time, and empty `extra` dict) that we don't need in CloudWatch.
+    Source: https://github.com/Delgan/loguru/blob/master/loguru/_handler.py (see `_serialize_record()`)
+
     Args:
         message: The loguru message object with .record attribute
     """
@@ -89,12 +126,88 @@ def cloudwatch_json_sink(message):
 
     # Convert to JSON and write to stderr with newline
     # The \n is REQUIRED for newline-delimited JSON (NDJSON) format
-    # CloudWatch expects each log entry on a separate line for proper parsing (hence, the `+ "\n"` at the end).
+    # CloudWatch expects each log entry on a separate line for proper parsing (hence, `OPT_APPEND_NEWLINE`).
     # See: https://docs.aws.amazon.com/AmazonCloudWatch/latest/monitoring/CloudWatch_Embedded_Metric_Format_Generation_CloudWatch_Agent.html#CloudWatch_Embedded_Metric_Format_Generation_CloudWatch_Agent_Send_Logs
-    # json.dumps() serializes the object to a single line. CloudWatch automatically parses this JSON
-    # and displays it as an expandable, multi-line structure in the AWS Console GUI.
-    sys.stderr.write(json.dumps(log_entry) + "\n")
-    sys.stderr.flush()
+    # orjson.dumps() serializes the object to a single line (as bytes, using a C implementation that's much
+    # faster than the stdlib `json` module), so we write it to our binary stderr buffer directly.
+    # CloudWatch automatically parses this JSON and displays it as an expandable, multi-line structure in the AWS Console GUI.
+    # Source: https://github.com/ijl/orjson#option
+    stderr_buffer.write(orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
+
+    # Don't keep errors waiting in the buffer, as they're the most important logs to see (e.g., before a crash)
+    if record["level"].no >= ERROR_LEVEL_NO:
+        stderr_buffer.flush()
+
+
+def flush_stderr_buffer_periodically():
+    """Flush the buffered stderr writer every `STDERR_FLUSH_INTERVAL_SECONDS` (runs in a daemon thread)."""
+    while True:
+        time.sleep(STDERR_FLUSH_INTERVAL_SECONDS)
+        stderr_buffer.flush()
+
+
+def flush_stderr_buffer_at_exit():
+    """Wait for loguru to process all enqueued messages, then flush whatever is left in the buffer."""
+    logger.complete()
+    stderr_buffer.flush()
+
+
+def configure_logger():
+    """Add this app's loguru handlers, unless they're all still registered.
+
+    Calling this more than once is cheap: handlers (and the formats they precompute) are only re-created
+    if some of them were removed in the meantime (e.g., by a test calling `logger.remove()`).
+    """
+    global handler_ids
+
+    # NOTE: Loguru has no public API to list the registered handlers, hence the use of `logger._core`
+    registered_handler_ids = logger._core.handlers
+    if handler_ids and all(handler_id in registered_handler_ids for handler_id in handler_ids):
+        return
+
+    # Remove whatever is left of our previous handlers before re-adding all of them
+    for handler_id in handler_ids:
+        if handler_id in registered_handler_ids:
+            logger.remove(handler_id)
+
+    # Add console handler for terminal output
+    # NOTE: We only enqueue log records (i.e., hand them over to a background worker) in AWS deployments.
+    #   Locally (and in tests), the sinks are fast enough that writing directly has lower latency than
+    #   going through loguru's queue.
+    handler_ids = [
+        logger.add(
+            log_sink,
+            format=log_format,
+            level=settings.LOGGING_LEVEL.upper(),
+            enqueue=is_aws_deployment,
+            colorize=enable_colors,
+            backtrace=False,
+            diagnose=False,
+            filter=log_filter if LOG_TEST_FILES_ONLY else None,
+            catch=False,
+        )
+    ]
+
+    # Write logs to all_logs.log file (IF we're running locally)
+    # NOTE: Loguru opens log files line-buffered by default (i.e., one write() syscall per log record), so we pass a
+    #   bigger `buffering` (forwarded to `open()`) to batch writes. The file is flushed when the buffer fills up,
+    #   and when loguru removes its handlers at exit (console output isn't affected by this).
+    #   Source: https://loguru.readthedocs.io/en/stable/api/logger.html#file
+    if settings.DEPLOYMENT_TYPE == "local":
+        handler_ids.append(
+            logger.add(
+                ALL_LOGS_FILE,
+                format=FILE_LOG_FORMAT,
+                level=settings.LOGGING_LEVEL.upper(),
+                enqueue=False,
+                backtrace=False,
+                diagnose=False,
+                filter=log_filter if LOG_TEST_FILES_ONLY else None,
+                rotation="10 MB",
+                buffering=LOG_FILE_BUFFER_SIZE,
+                catch=False,
+            )
+        )
 
 ########################################## Main Code ##########################################
 
@@ -104,6 +217,13 @@ if is_aws_deployment:
     # This creates clean, minimal JSON logs that are easy to query in CloudWatch Logs Insights
     log_sink = cloudwatch_json_sink
 
+    # Write to stderr's file descriptor through our own (larger) buffer, which is flushed periodically by a
+    # background thread, and once more when the process exits
+    # Source: https://docs.python.org/3/library/io.html#io.BufferedWriter
+    stderr_buffer = io.BufferedWriter(io.FileIO(sys.stderr.fileno(), "wb", closefd=False), buffer_size=STDERR_BUFFER_SIZE)
+    threading.Thread(target=flush_stderr_buffer_periodically, name="stderr-log-flusher", daemon=True).start()
+    atexit.register(flush_stderr_buffer_at_exit)
+
     # Format string for loguru - optimization for custom sink
     # Explanation: Loguru always formats the message string before passing it to the sink.
     # Since our sink uses the raw .record object and handles its own formatting, we use
@@ -114,41 +234,8 @@ if is_aws_deployment:
 else:
     # Standard stderr sink for local development
     log_sink = sys.stderr
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <4}</level> | "
-        "<cyan>{file}</cyan>:<cyan>{line}</cyan> "
-        "<blue>[{function}()]</blue> | "
-        "<level>{message}</level>"
-    )
+    log_format = CONSOLE_LOG_FORMAT
     enable_colors = True
 
-# Add console handler for terminal output
-logger.add(
-    log_sink,
-    format=log_format,
-    level=settings.LOGGING_LEVEL.upper(),
-    enqueue=True,
-    colorize=enable_colors,
-    backtrace=False,
-    diagnose=False,
-    filter=log_filter,
-    catch=False,
-)
-
-# Write logs to all_logs.log file (IF we're running locally)
-if settings.DEPLOYMENT_TYPE == "local":
-    log_dir = os.path.join(os.getcwd(), "logs")
-    os.makedirs(log_dir, exist_ok=True)
-    all_logs_file = os.path.join(log_dir, "all_logs.log")
-    logger.add(
-        all_logs_file,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {file}:{line} [{function}()] | {message}",
-        level=settings.LOGGING_LEVEL.upper(),
-        enqueue=True,
-        backtrace=False,
-        diagnose=False,
-        filter=log_filter,
-        rotation="10 MB",
-        catch=False,
-    )
+# Add this app's handlers (console, and file if we're running locally)
+configure_logger()
@@ -119,12 +119,12 @@ class WhatsAppSettings(BaseSettings):
         1. In local mode: adds localhost and zrok origins
         2. In all environments: adds GitHub Actions testserver origin and WhatsApp Web
         """
-        origins = v.copy()
+        extra_origins = []
 
-        # Add BACKEND_SERVER_URL as an origin if it's not already present
+        # Add BACKEND_SERVER_URL as an origin
         backend_url = info.data.get("BACKEND_SERVER_URL")
-        if backend_url and backend_url not in origins:
-            origins.append(backend_url)
+        if backend_url:
+            extra_origins.append(backend_url)
 
         # Add local-specific origins when in local mode
         if info.data.get("DEPLOYMENT_TYPE") == "local":
@@ -135,19 +135,16 @@ class WhatsAppSettings(BaseSettings):
             #   and so, a value in "host" header means it won't contain the "https://" prefix
             #   However, even if you don't explicitly remove the "https://" part,
             #   apparently FastAPI will still correctly recognize the host
-            webhook_origin = f"{token_value}.share.zrok.io"
-            if webhook_origin not in origins:
-                origins.append(webhook_origin)
+            extra_origins.append(f"{token_value}.share.zrok.io")
 
         # Make sure CI/CD of GitHub Actions is allowed in all environments
-        if "testserver" not in origins:
-            origins.append("testserver")
+        extra_origins.append("testserver")
 
         # Always allow WhatsApp Web origin
-        if "https://web.whatsapp.com" not in origins:
-            origins.append("https://web.whatsapp.com")
+        extra_origins.append("https://web.whatsapp.com")
 
-        return origins
+        # Remove duplicates while preserving order (dict keys are unique and keep insertion order)
+        return list(dict.fromkeys(v + extra_origins))
 
 
 @lru_cache
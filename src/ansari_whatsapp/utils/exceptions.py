@@ -35,3 +35,17 @@ class ThreadInfoError(AnsariClientError):
 class MessageProcessingError(AnsariClientError):
     """Message processing failed."""
     pass
+
+
+class WebhookPayloadError(ValueError):
+    """Webhook payload received from Meta is invalid or unsupported.
+
+    Args:
+        message (str): A short description of the problem (without the payload itself).
+        payload (object | None): The offending (part of the) payload, kept by reference so that it's
+            only formatted if someone actually logs it.
+    """
+
+    def __init__(self, message: str, payload: object | None = None):
+        super().__init__(message)
+        self.payload = payload
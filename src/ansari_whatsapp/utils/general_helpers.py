@@ -2,7 +2,6 @@
 """General utility functions that can be used across the codebase."""
 
 import json
-from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
@@ -11,67 +10,80 @@ from urllib.parse import urlparse
 
 # Custom CORS middleware to log errors that occur in the middleware layer (if any)
 class CORSMiddlewareWithLogging(CORSMiddleware):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Starlette keeps `allow_origins` as the given list, so we use a set for O(1) membership tests
+        self.allow_origins_set = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        """Same check as Starlette's, but with a set lookup instead of a list scan.
+
+        NOTE: Starlette's CORSMiddleware also calls this method internally (for preflight and simple requests).
+        """
+        if self.allow_all_origins:
+            return True
+
+        if self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin):
+            return True
+
+        return origin in self.allow_origins_set
+
     async def __call__(self, scope, receive, send):
         """Override the __call__ method to add logging"""
         # Skip CORS processing for non-HTTP requests (e.g., WebSockets)
         if scope["type"] != "http":  # pragma: no cover
             return await super().__call__(scope, receive, send)
 
-        logger.debug("Starting CORS middleware processing")
-
-        # Create a Request object for logging
-        request = Request(scope, receive)
-
-        async def modified_send(message):
-            """Intercept response to log CORS errors"""
-            if message["type"] == "http.response.start":
-                status = message["status"]
-                # Common request details
-                request_details = (
-                    f"Status: {status}\n"
-                    f"Path: {request.url.path}\n"
-                    f"Method: {request.method}\n"
-                    f"Origin: {request.headers.get('origin')}\n"
-                    f"Host: {request.headers.get('host')}"
-                )
-
-                # Log CORS-related errors (if any)
-                if request.headers.get("origin") is not None and request.headers.get("origin") not in self.allow_origins:
-                    logger.error(
-                        f"CORS Origin Error\n"
-                        f"Incoming Origin: {request.headers.get('origin')}\n"
-                        f"Incoming Host: {request.headers.get('host')}\n"
-                        f"But the allowed Origins:\n{json.dumps(self.allow_origins, indent=2)}"
-                    )
-                # Else log issues that occur in the middleware layer (if any)
-                elif any(
-                    [
-                        status == 400 and request.method == "OPTIONS",
-                        status == 401 and "Authorization" not in request.headers,
-                        status == 403 and request.headers.get("origin") not in self.allow_origins,
-                        status == 429,
-                    ]
-                ):
-                    logger.error(f"Middleware Error\n{request_details}")
-            await send(message)
+        # Read the origin header directly from the ASGI scope (i.e., without creating a Request object)
+        origin = get_header_from_scope(scope, b"origin")
+
+        # Log CORS-related errors (if any)
+        # NOTE: Requests without an Origin header (e.g., Meta's webhooks) or from an allowed origin (i.e., the usual case)
+        #   have nothing to log here, so they're passed to Starlette's CORSMiddleware as they are
+        if origin is not None and not self.is_allowed_origin(origin):
+            # `lazy=True` makes loguru call the lambdas only if the log record is actually emitted
+            logger.opt(lazy=True).error(
+                "CORS Origin Error\nIncoming Origin: {}\nIncoming Host: {}\nBut the allowed Origins:\n{}",
+                lambda: origin,
+                lambda: get_header_from_scope(scope, b"host"),
+                lambda: json.dumps(self.allow_origins, indent=2),
+            )
 
         try:
-            await super().__call__(scope, receive, modified_send)
+            await super().__call__(scope, receive, send)
         except Exception as e:
-            logger.error(
-                (
-                    f"Unhandled Middleware Error\nType: {type(e).__name__}\n"
-                    f"Message: {str(e)}\n"
-                    f"Path: {request.url.path}\n"
-                    f"Method: {request.method}\n"
-                    f"Origin: {request.headers.get('origin')}\n"
-                    f"Host: {request.headers.get('host')}"
-                ),
-                exc_info=True,
+            # NOTE: We use `opt(exception=True)` (instead of passing `exc_info=True`), as loguru treats keyword
+            #   arguments as formatting arguments (i.e., the message would break if it contains braces)
+            logger.opt(exception=True).error(
+                f"Unhandled Middleware Error\nType: {type(e).__name__}\n"
+                f"Message: {str(e)}\n"
+                f"Path: {scope['path']}\n"
+                f"Method: {scope['method']}\n"
+                f"Origin: {origin}\n"
+                f"Host: {get_header_from_scope(scope, b'host')}"
             )
             raise
 
 
+def get_header_from_scope(scope, header_name: bytes) -> str | None:
+    """Get a header's value directly from an ASGI scope (i.e., without creating a Request object).
+
+    Args:
+        scope: The ASGI (HTTP) connection scope.
+        header_name: The lowercased header name, as bytes (e.g., b"origin").
+
+    Returns:
+        str | None: The header's (first) value, or None if the header isn't present.
+
+    NOTE: ASGI servers give header names lowercased, as a list of (bytes, bytes) tuples.
+    Source: https://asgi.readthedocs.io/en/latest/specs/www.html#http-connection-scope
+    """
+    for name, value in scope["headers"]:
+        if name == header_name:
+            return value.decode("latin-1")
+    return None
+
+
 def get_base_url(url):
     parsed = urlparse(url)
     return f"{parsed.scheme}://{parsed.netloc}"
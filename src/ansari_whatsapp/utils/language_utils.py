@@ -5,6 +5,10 @@ import re
 from typing import Literal
 
 
+# Arabic script characters (Arabic, Arabic Supplement, Arabic Extended-A, and Arabic Presentation Forms A & B)
+RTL_CHARS_PATTERN = re.compile(r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]+")
+
+
 def get_language_from_text(text: str) -> str:
     """
     Detect the language of the text.
@@ -34,11 +38,16 @@ def get_language_direction_from_text(text: str) -> Literal["ltr", "rtl", "unknow
     Returns:
         Literal["ltr", "rtl", "unknown"]: The detected text direction.
     """
-    # If the text has more rtl characters than ltr, it's considered rtl
-    rtl_chars = re.findall(
-        r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]+", text
-    )
-    rtl_count = sum(len(match) for match in rtl_chars)
+    if not text:
+        return "unknown"
+
+    # Fast path: ASCII-only text can't contain RTL characters
+    # NOTE: `str.isascii()` is O(1) in CPython, as strings already know whether they're ASCII-only
+    if text.isascii():
+        return "ltr"
+
+    # Count RTL characters by removing them (in one C-level pass) and comparing lengths
+    rtl_count = len(text) - len(RTL_CHARS_PATTERN.sub("", text))
 
     # If more than 30% of characters are RTL, consider it RTL
     if rtl_count / len(text) > 0.3:
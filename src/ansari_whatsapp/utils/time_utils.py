@@ -1,12 +1,44 @@
 # Time Utilities
 """Utilities for time-related calculations and formatting."""
 
+import time
 from datetime import datetime, timezone
 
 from loguru import logger
 
 from ansari_whatsapp.utils.config import get_settings
 
+# Units used to format time deltas, as (upper limit in seconds, seconds per unit, unit suffix) tuples
+# NOTE: Values that aren't below any limit (i.e., infinity) are formatted using the last unit
+TIME_UNITS_VERBOSE = (
+    (60, 1, " seconds"),
+    (3600, 60, " minutes"),
+    (86400, 3600, " hours"),
+    (float("inf"), 86400, " days"),
+)
+TIME_UNITS_COMPACT = (
+    (60, 1, "sec"),
+    (3600, 60, "mins"),
+    (86400, 3600, "hours"),
+    (float("inf"), 86400, "days"),
+)
+
+
+def format_seconds_with_units(seconds: float, units: tuple[tuple[float, int, str], ...]) -> str:
+    """Format a number of seconds using the first unit whose upper limit is greater than it.
+
+    Args:
+        seconds (float): Time delta in seconds
+        units (tuple[tuple[float, int, str], ...]): Units to use (e.g., TIME_UNITS_VERBOSE)
+
+    Returns:
+        str: Formatted string (e.g., "5.2 seconds" or "5.2sec")
+    """
+    for limit, seconds_per_unit, suffix in units:
+        if seconds < limit:
+            break
+    return f"{seconds / seconds_per_unit:.1f}{suffix}"
+
 
 def format_time_delta(seconds: float) -> str:
     """Format a time delta in seconds to a human-readable string.
@@ -17,21 +49,15 @@ def format_time_delta(seconds: float) -> str:
     Returns:
         str: Formatted string (e.g., "5.2 seconds", "3.1 minutes", "2.5 hours", "1.2 days")
     """
-    if seconds < 60:
-        return f"{seconds:.1f} seconds"
-    elif seconds < 3600:
-        return f"{seconds / 60:.1f} minutes"
-    elif seconds < 86400:
-        return f"{seconds / 3600:.1f} hours"
-    else:
-        return f"{seconds / 86400:.1f} days"
+    return format_seconds_with_units(seconds, TIME_UNITS_VERBOSE)
 
 
-def calculate_time_passed(last_message_time: datetime | None) -> tuple[float, str]:
+def calculate_time_passed(last_message_time: datetime | None, now: datetime | None = None) -> tuple[float, str]:
     """Calculate the time passed since the last message.
 
     Args:
         last_message_time (datetime | None): The timestamp of the last message.
+        now (datetime | None): The current (UTC) time, if the caller already has it. Defaults to `datetime.now(timezone.utc)`.
 
     Returns:
         tuple[float, str]: The time passed in seconds and a formatted string for logging.
@@ -39,17 +65,10 @@ def calculate_time_passed(last_message_time: datetime | None) -> tuple[float, st
     if last_message_time is None:
         passed_time = float("inf")
     else:
-        passed_time = (datetime.now(timezone.utc) - last_message_time).total_seconds()
+        passed_time = ((now or datetime.now(timezone.utc)) - last_message_time).total_seconds()
 
     # Format for logging (compact version)
-    if passed_time < 60:
-        passed_time_logging = f"{passed_time:.1f}sec"
-    elif passed_time < 3600:
-        passed_time_logging = f"{passed_time / 60:.1f}mins"
-    elif passed_time < 86400:
-        passed_time_logging = f"{passed_time / 3600:.1f}hours"
-    else:
-        passed_time_logging = f"{passed_time / 86400:.1f}days"
+    passed_time_logging = format_seconds_with_units(passed_time, TIME_UNITS_COMPACT)
 
     return passed_time, passed_time_logging
 
@@ -65,7 +84,7 @@ def get_retention_time_seconds() -> int:
     return retention_hours * 60 * 60
 
 
-def is_message_too_old(message_unix_time: int | None) -> bool:
+def is_message_too_old(message_unix_time: int | None, now: datetime | None = None) -> bool:
     """Check if an incoming message is older than the allowed threshold.
 
     Uses the message timestamp (Unix time format - seconds since epoch)
@@ -73,6 +92,7 @@ def is_message_too_old(message_unix_time: int | None) -> bool:
 
     Args:
         message_unix_time (int | None): The message timestamp in Unix time format.
+        now (datetime | None): The current (UTC) time, if the caller already has it. Defaults to `datetime.now(timezone.utc)`.
 
     Returns:
         bool: True if the message is older than the threshold, False otherwise
@@ -85,13 +105,11 @@ def is_message_too_old(message_unix_time: int | None) -> bool:
         logger.debug("No timestamp available, cannot determine message age")
         return False
 
-    # Convert the Unix timestamp to a datetime object
+    # Calculate time difference in seconds, directly on Unix timestamps (i.e., without creating datetime objects)
+    # NOTE: Unix timestamps are UTC-based, so no timezone handling is needed here
     try:
-        msg_time = datetime.fromtimestamp(message_unix_time, tz=timezone.utc)
-        # Get the current time in UTC
-        current_time = datetime.now(timezone.utc)
-        # Calculate time difference in seconds
-        time_diff = (current_time - msg_time).total_seconds()
+        current_unix_time = now.timestamp() if now else time.time()
+        time_diff = current_unix_time - message_unix_time
 
         # Log the message age for debugging
         age_logging = format_time_delta(time_diff)
@@ -100,6 +118,6 @@ def is_message_too_old(message_unix_time: int | None) -> bool:
         # Return True if the message is older than the threshold
         return time_diff > too_old_threshold
 
-    except (ValueError, TypeError) as e:
+    except TypeError as e:
         logger.error(f"Error parsing message timestamp: {e}")
         return False
@@ -2,11 +2,17 @@
 """Utilities for splitting long messages into WhatsApp-compliant chunks."""
 
 import re
+from typing import Callable
 
 
 # WhatsApp character limit
 WHATSAPP_MAX_MESSAGE_LENGTH = 4000
 
+# Patterns used to split messages (compiled once, at import time)
+HEADER_PATTERN = re.compile(r"\*_[^*_]+_\*")  # *_HEADER_*
+BOLD_PATTERN = re.compile(r"\*[^*]+\*")  # *BOLD*
+PARAGRAPH_SEPARATOR_PATTERN = re.compile(r"\n\n+")  # Double (or more) newlines
+
 
 def split_message(msg_body: str) -> list[str]:
     """Split long messages into smaller chunks based on formatted headers or other patterns.
@@ -33,12 +39,10 @@ def split_message(msg_body: str) -> list[str]:
         return header_chunks
 
     # Strategy 2: Try to split by bold formatting (*BOLD*)
-    bold_chunks = split_by_bold_text(msg_body, WHATSAPP_MAX_MESSAGE_LENGTH)
-    if len(bold_chunks) > 1:
-        return bold_chunks
-
     # Strategy 3: Fall back to paragraph-based splitting
-    return split_by_paragraphs(msg_body, WHATSAPP_MAX_MESSAGE_LENGTH)
+    # NOTE: `split_by_bold_text()` already falls back to paragraph-based splitting when there aren't enough bold patterns,
+    #   so its result is returned as is (instead of splitting the whole message by paragraphs a second time)
+    return split_by_bold_text(msg_body, WHATSAPP_MAX_MESSAGE_LENGTH)
 
 
 def split_by_headers(text: str, max_length: int) -> list[str]:
@@ -51,45 +55,19 @@ def split_by_headers(text: str, max_length: int) -> list[str]:
     Returns:
         list[str]: List of text chunks split by headers
     """
+    # Skip the regex scan if the text can't contain any header (a C-level substring search is much cheaper)
+    if "*_" not in text:
+        return [text]
+
     # Look for *_HEADER_* pattern
-    header_pattern = re.compile(r"\*_[^*_]+_\*")
-    headers = list(header_pattern.finditer(text))
+    headers = list(HEADER_PATTERN.finditer(text))
 
     # If we don't have multiple headers, we can't split effectively
-    if not headers or len(headers) <= 1:
+    if len(headers) <= 1:
         return [text]
 
-    chunks = []
-
-    # Process each header as a potential chunk boundary
-    for i, match in enumerate(headers):
-        # For the first header, handle any text that comes before it
-        if i == 0 and match.start() > 0:
-            prefix = text[: match.start()]
-
-            # Always include the text before the first header in its own message(s)
-            # If it's too long, recursively split it
-            if len(prefix) <= max_length:
-                chunks.append(prefix)
-            else:
-                # If prefix is too long, split it using paragraph-based splitting
-                prefix_chunks = split_by_paragraphs(prefix, max_length)
-                chunks.extend(prefix_chunks)
-
-        # Determine the end position for the chunk containing this header
-        end_pos = headers[i + 1].start() if i < len(headers) - 1 else len(text)
-        chunk = text[match.start() : end_pos]
-
-        # If chunk fits within limit, add it directly
-        if len(chunk) <= max_length:
-            chunks.append(chunk)
-        else:
-            # Otherwise, try more aggressive splitting for this chunk
-            # First try bold formatting, then paragraphs
-            sub_chunks = split_by_bold_text(chunk, max_length)
-            chunks.extend(sub_chunks)
-
-    return chunks
+    # Chunks that are still too long are split further, first by bold formatting, then by paragraphs
+    return split_at_matches(text, max_length, headers, split_by_bold_text)
 
 
 def split_by_bold_text(text: str, max_length: int) -> list[str]:
@@ -105,42 +83,58 @@ def split_by_bold_text(text: str, max_length: int) -> list[str]:
     if len(text) <= max_length:
         return [text]
 
+    # Skip the regex scan if the text can't contain any bold pattern (which needs at least two asterisks)
+    if text.count("*") < 2:
+        return split_by_paragraphs(text, max_length)
+
     # Find *TEXT* patterns
-    bold_pattern = re.compile(r"\*[^*]+\*")
-    bold_matches = list(bold_pattern.finditer(text))
+    bold_matches = list(BOLD_PATTERN.finditer(text))
 
     # If we don't have enough bold patterns for effective splitting
-    if not bold_matches or len(bold_matches) <= 1:
+    if len(bold_matches) <= 1:
         return split_by_paragraphs(text, max_length)
 
-    chunks = []
+    # Chunks that are still too long are split further by paragraphs
+    return split_at_matches(text, max_length, bold_matches, split_by_paragraphs)
 
-    # Process each bold pattern as a potential chunk boundary
-    for i, match in enumerate(bold_matches):
-        # For the first bold pattern, handle any text that comes before it
-        if i == 0 and match.start() > 0:
-            prefix = text[: match.start()]
 
-            # Always include the text before the first bold pattern in its own message(s)
-            # If it's too long, recursively split it
-            if len(prefix) <= max_length:
-                chunks.append(prefix)
-            else:
-                # If prefix is too long, split it using paragraph-based splitting
-                prefix_chunks = split_by_paragraphs(prefix, max_length)
-                chunks.extend(prefix_chunks)
+def split_at_matches(
+    text: str,
+    max_length: int,
+    matches: list[re.Match],
+    split_long_chunk: Callable[[str, int], list[str]],
+) -> list[str]:
+    """Split text so that each chunk starts at one of the given pattern matches (e.g., a header).
 
-        # Determine the end position for the chunk containing this bold pattern
-        end_pos = bold_matches[i + 1].start() if i < len(bold_matches) - 1 else len(text)
+    Args:
+        text (str): Text to split
+        max_length (int): Maximum allowed length of each chunk
+        matches (list[re.Match]): Matches (of a single pattern) in `text`, used as chunk boundaries
+        split_long_chunk (Callable[[str, int], list[str]]): Splitter used for chunks that are still too long
+
+    Returns:
+        list[str]: List of text chunks split at the given matches
+    """
+    chunks = []
+
+    # Always include the text before the first match in its own message(s)
+    # If it's too long, split it using paragraph-based splitting
+    first_match_start = matches[0].start()
+    if first_match_start > 0:
+        chunks.extend(split_by_paragraphs(text[:first_match_start], max_length))
+
+    # Process each match as a chunk boundary
+    for i, match in enumerate(matches):
+        # Determine the end position for the chunk containing this match
+        end_pos = matches[i + 1].start() if i < len(matches) - 1 else len(text)
         chunk = text[match.start() : end_pos]
 
         # If chunk fits within limit, add it directly
         if len(chunk) <= max_length:
             chunks.append(chunk)
         else:
-            # Otherwise, fall back to paragraph splitting for this chunk
-            sub_chunks = split_by_paragraphs(chunk, max_length)
-            chunks.extend(sub_chunks)
+            # Otherwise, try more aggressive splitting for this chunk
+            chunks.extend(split_long_chunk(chunk, max_length))
 
     return chunks
 
@@ -158,45 +152,52 @@ def split_by_paragraphs(text: str, max_length: int) -> list[str]:
     if len(text) <= max_length:
         return [text]
 
-    chunks = []
-
-    # Try splitting by paragraphs first (double newlines)
-    paragraphs = re.split(r"\n\n+", text)
+    # If text doesn't have paragraphs, use fixed-size chunk splitting (skipping the regex split altogether)
+    if "\n\n" not in text:
+        return split_by_fixed_chunks(text, max_length)
 
-    if len(paragraphs) > 1:
-        current = ""
+    chunks = []
 
-        for para in paragraphs:
-            # If adding this paragraph would exceed the limit
-            if current and len(current) + len(para) + 2 > max_length:
-                chunks.append(current)
-                current = ""
+    # Split by paragraphs (double newlines)
+    paragraphs = PARAGRAPH_SEPARATOR_PATTERN.split(text)
+
+    # Paragraphs of the chunk being built (joined once, when the chunk is complete),
+    # along with the length the joined chunk will have
+    current_parts = []
+    current_len = 0
+
+    for para in paragraphs:
+        # If adding this paragraph would exceed the limit
+        if current_len and current_len + len(para) + 2 > max_length:
+            chunks.append("\n\n".join(current_parts))
+            current_parts = []
+            current_len = 0
+
+        # If paragraph itself is too long, split it using fixed chunks
+        if len(para) > max_length:
+            # Add any accumulated text first
+            if current_len:
+                chunks.append("\n\n".join(current_parts))
+                current_parts = []
+                current_len = 0
+
+            # Use fixed-size chunk splitting for long paragraphs
+            para_chunks = split_by_fixed_chunks(para, max_length)
+            chunks.extend(para_chunks)
+        else:
+            # Add paragraph to current chunk with proper separator (i.e., the "\n\n" added by `join()`)
+            if current_len:
+                current_parts.append(para)
+                current_len += len(para) + 2
+            else:
+                current_parts = [para]
+                current_len = len(para)
 
-            # If paragraph itself is too long, split it using fixed chunks
-            if len(para) > max_length:
-                # Add any accumulated text first
-                if current:
-                    chunks.append(current)
-                    current = ""
+    # Don't forget the last chunk
+    if current_len:
+        chunks.append("\n\n".join(current_parts))
 
-                # Use fixed-size chunk splitting for long paragraphs
-                para_chunks = split_by_fixed_chunks(para, max_length)
-                chunks.extend(para_chunks)
-            else:
-                # Add paragraph to current chunk with proper separator
-                if current:
-                    current += "\n\n" + para
-                else:
-                    current = para
-
-        # Don't forget the last chunk
-        if current:
-            chunks.append(current)
-
-        return chunks
-    else:
-        # If text doesn't have paragraphs, use fixed-size chunk splitting
-        return split_by_fixed_chunks(text, max_length)
+    return chunks
 
 
 def split_by_fixed_chunks(text: str, max_length: int) -> list[str]:
@@ -213,10 +214,5 @@ def split_by_fixed_chunks(text: str, max_length: int) -> list[str]:
     if len(text) <= max_length:
         return [text]
 
-    chunks = []
-
     # Simply take max_length characters at a time
-    for i in range(0, len(text), max_length):
-        chunks.append(text[i : i + max_length])
-
-    return chunks
+    return [text[i : i + max_length] for i in range(0, len(text), max_length)]
@@ -9,14 +9,40 @@ This module contains functions for:
 
 import hmac
 import hashlib
+import time
+from typing import NamedTuple
+
+import orjson
 from loguru import logger
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse, Response
 
 from ansari_whatsapp.utils.config import get_settings
+from ansari_whatsapp.utils.exceptions import WebhookPayloadError
 
 settings = get_settings()
 
+# Settings read on every webhook request (resolved once, at import time)
+# NOTE: This assumes settings don't change at runtime, which holds as `get_settings()` is cached
+CONFIGURED_PHONE_NUMBER_ID = settings.META_BUSINESS_PHONE_NUMBER_ID.get_secret_value()
+ALWAYS_RETURN_OK_TO_META = settings.ALWAYS_RETURN_OK_TO_META
+# Length of a hex-encoded SHA256 digest (i.e., of the signature Meta sends in the X-Hub-Signature-256 header)
+SHA256_HEX_DIGEST_LENGTH = hashlib.sha256().digest_size * 2
+# HMAC-SHA256 keyed with Meta's app secret, but not fed any data yet (used by `verify_meta_signature()`)
+# NOTE: Creating an HMAC object hashes the (padded) key into its inner/outer states, so we only do that once here,
+#   and give each request a `.copy()` of these precomputed states instead
+#   Source: https://docs.python.org/3/library/hmac.html#hmac.HMAC.copy
+META_SIGNATURE_HMAC = hmac.new(settings.META_ANSARI_APP_SECRET.get_secret_value().encode("utf-8"), digestmod=hashlib.sha256)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes its content with orjson (much faster than the stdlib `json` module).
+
+    NOTE: We don't use FastAPI's own `ORJSONResponse`, as it's deprecated in recent FastAPI versions.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
 
 
 async def verify_meta_signature(request: Request) -> None:
@@ -46,7 +72,9 @@ async def verify_meta_signature(request: Request) -> None:
     body_bytes = await request.body()
     signature_header = request.headers.get("X-Hub-Signature-256", "")
 
-    if not signature_header or not signature_header.startswith("sha256="):
+    # NOTE: We also reject signatures that can't be a hex-encoded SHA256 digest (i.e., 64 chars) before computing
+    #   any HMAC, so that malformed requests don't cost us a pass over the request body
+    if not signature_header.startswith("sha256=") or len(signature_header) != len("sha256=") + SHA256_HEX_DIGEST_LENGTH:
         logger.warning("Missing or invalid X-Hub-Signature-256 header format")
         logger.error("Webhook signature verification failed - rejecting request")
         raise HTTPException(
@@ -55,15 +83,20 @@ async def verify_meta_signature(request: Request) -> None:
             headers={"WWW-Authenticate": "HMAC-SHA256"},
         )
 
-    # Extract the received signature from the header (remove "sha256=" prefix)
-    signature_received_from_meta = signature_header.replace("sha256=", "")
+    # Extract the received signature from the header (remove "sha256=" prefix), and decode it to raw digest bytes
+    # NOTE: A signature that isn't valid hex can't match ours, so we treat it as an empty (i.e., mismatching) digest
+    try:
+        signature_received_from_meta = bytes.fromhex(signature_header[len("sha256="):])
+    except ValueError:
+        signature_received_from_meta = b""
 
-    # Extract our server's signature by 
+    # Extract our server's signature by
     # computing HMAC-SHA256 using meta's app secret
-    app_secret = settings.META_ANSARI_APP_SECRET.get_secret_value().encode('utf-8')
-    computed_signature = hmac.new(app_secret, body_bytes, hashlib.sha256).hexdigest()
-    
-    # Attempt secret verification by comparing signatures
+    signature_hmac = META_SIGNATURE_HMAC.copy()
+    signature_hmac.update(body_bytes)
+    computed_signature = signature_hmac.digest()
+
+    # Attempt secret verification by comparing signatures (as raw 32-byte digests)
     # (i.e., if signatures match, then the app secret used to compute both signatures is the same)
     is_valid = hmac.compare_digest(computed_signature, signature_received_from_meta)
 
@@ -110,7 +143,7 @@ def create_response_for_meta(
     response_body = {
         "success": success,
         "message": message,
-        "timestamp": int(__import__("time").time())
+        "timestamp": int(time.time())
     }
 
     if error_code:
@@ -120,76 +153,95 @@ def create_response_for_meta(
         response_body["details"] = details
 
     # When ALWAYS_RETURN_OK_TO_META is False: return proper HTTP status codes (for testing)
-    # When ALWAYS_RETURN_OK_TO_META is True: always return 200 for Meta compliance
-    if not settings.ALWAYS_RETURN_OK_TO_META:
-        return JSONResponse(
-            content=response_body,
-            status_code=status_code if not success else 200
-        )
+    # When ALWAYS_RETURN_OK_TO_META is True: always return 200 for Meta compliance (production behavior),
+    #   but still include the structured response body for logging/debugging
+    response_status_code = 200 if success or ALWAYS_RETURN_OK_TO_META else status_code
 
-    # Always return 200 for Meta compliance (production behavior)
-    # But still include structured response body for logging/debugging
-    return JSONResponse(
+    return ORJSONResponse(
         content=response_body,
-        status_code=200
+        status_code=response_status_code
     )
 
 
-async def parse_meta_payload(
-    body: dict[str, dict],
-) -> tuple[bool, bool, str | None, str | None, dict | None, str | None, int | None]:
+class ParsedWebhook(NamedTuple):
+    """Message details extracted from a webhook payload by `parse_meta_payload()`.
+
+    Fields other than `is_target_business_number` are None when they don't apply
+    (e.g., all of them are None for webhooks not intended for our business number).
+    """
+
+    is_status: bool | None
+    is_target_business_number: bool
+    user_whatsapp_number: str | None = None
+    incoming_msg_type: str | None = None
+    incoming_msg_body: dict | None = None
+    message_id: str | None = None
+    message_unix_time: int | None = None
+
+
+async def parse_meta_payload(body_bytes: bytes) -> ParsedWebhook:
     """
     Parse the webhook payload received from Meta to extract relevant message details.
 
     Args:
-        body (dict[str, dict]): The JSON body of the incoming webhook request from Meta.
+        body_bytes (bytes): The raw JSON body of the incoming webhook request from Meta
+            (i.e., the same bytes that were used to verify the request's signature).
 
     Returns:
-        tuple: A tuple of (is_status, is_target_business_number, user_whatsapp_number,
-               incoming_msg_type, incoming_msg_body, message_id, message_unix_time)
+        ParsedWebhook: The extracted message details (a NamedTuple, so it can still be unpacked like a tuple).
 
     Raises:
-        Exception: If the payload structure is invalid or unsupported.
+        WebhookPayloadError: If the payload isn't valid JSON, or its structure is invalid or unsupported.
     """
-    if not (
-        body.get("object")
-        and (entry := body.get("entry", []))
-        and (changes := entry[0].get("changes", []))
-        and (value := changes[0].get("value", {}))
-    ):
-        error_msg = f"Invalid received payload from WhatsApp user and/or problem with Meta's API:\n{body}"
-        logger.error(error_msg)
-        raise Exception(error_msg)
+    # Parse the JSON payload using orjson (i.e., a C implementation that's much faster than the stdlib `json` module)
+    try:
+        body = orjson.loads(body_bytes)
+    except orjson.JSONDecodeError as e:
+        logger.error("Received a webhook payload that isn't valid JSON: {}", e)
+        raise WebhookPayloadError("Received a webhook payload that isn't valid JSON", payload=body_bytes) from e
+
+    # Get the payload's "value" object (i.e., `body["entry"][0]["changes"][0]["value"]`), one level at a time
+    entry = body.get("entry") if isinstance(body, dict) and body.get("object") else None
+    if not entry:
+        logger.error("Invalid received payload from WhatsApp user and/or problem with Meta's API:\n{}", body)
+        raise WebhookPayloadError("Invalid received payload from WhatsApp user and/or problem with Meta's API", payload=body)
+
+    changes = entry[0].get("changes")
+    if not changes:
+        logger.error("Missing changes in webhook payload from WhatsApp API:\n{}", body)
+        raise WebhookPayloadError("Missing changes in webhook payload from WhatsApp API", payload=body)
+
+    value = changes[0].get("value")
+    if not value:
+        logger.error("Missing value in webhook payload from WhatsApp API:\n{}", body)
+        raise WebhookPayloadError("Missing value in webhook payload from WhatsApp API", payload=body)
 
     # Check if this webhook is intended for our WhatsApp business number
     # Metadata should always be present in a valid webhook payload
-    if "metadata" not in value:
-        error_msg = f"Missing metadata in webhook payload from WhatsApp API:\n{value}"
-        logger.error(error_msg)
-        raise Exception(error_msg)
+    metadata = value.get("metadata")
+    if metadata is None:
+        logger.error("Missing metadata in webhook payload from WhatsApp API:\n{}", value)
+        raise WebhookPayloadError("Missing metadata in webhook payload from WhatsApp API", payload=value)
 
-    if "phone_number_id" not in value["metadata"]:
-        error_msg = f"Missing phone_number_id in webhook payload metadata:\n{value['metadata']}"
-        logger.error(error_msg)
-        raise Exception(error_msg)
+    incoming_phone_number_id = metadata.get("phone_number_id")
+    if incoming_phone_number_id is None:
+        logger.error("Missing phone_number_id in webhook payload metadata:\n{}", metadata)
+        raise WebhookPayloadError("Missing phone_number_id in webhook payload metadata", payload=metadata)
 
-    incoming_phone_number_id = value["metadata"]["phone_number_id"]
-    configured_phone_number_id = settings.META_BUSINESS_PHONE_NUMBER_ID.get_secret_value()
-    is_target_business_number = incoming_phone_number_id == configured_phone_number_id
+    is_target_business_number = incoming_phone_number_id == CONFIGURED_PHONE_NUMBER_ID
 
     if not is_target_business_number:
-        return None, is_target_business_number, None, None, None, None, None
+        return ParsedWebhook(is_status=None, is_target_business_number=is_target_business_number)
 
     if "statuses" in value:
         # This is a status update (delivered, read, etc.), not a user message
-        return True, is_target_business_number, None, None, None, None, None
+        return ParsedWebhook(is_status=True, is_target_business_number=is_target_business_number)
 
     is_status = False
 
     if "messages" not in value:
-        error_msg = f"Unsupported message type received from WhatsApp user:\n{body}"
-        logger.error(error_msg)
-        raise Exception(error_msg)
+        logger.error("Unsupported message type received from WhatsApp user:\n{}", body)
+        raise WebhookPayloadError("Unsupported message type received from WhatsApp user", payload=body)
 
     incoming_msg = value["messages"][0]
 
@@ -201,17 +253,21 @@ async def parse_meta_payload(
 
     # Meta API note: Meta sends "errors" key when receiving unsupported message types
     # (e.g., video notes, gifs sent from giphy, or polls)
-    incoming_msg_type = incoming_msg["type"] if incoming_msg["type"] in incoming_msg.keys() else "errors"
+    incoming_msg_type = incoming_msg["type"]
+    if incoming_msg_type not in incoming_msg:
+        incoming_msg_type = "errors"
     incoming_msg_body = incoming_msg[incoming_msg_type]
 
-    logger.info(f"Received a supported whatsapp message from {user_whatsapp_number}: {incoming_msg_body}")
-
-    return (
-        is_status,
-        is_target_business_number,
-        user_whatsapp_number,
-        incoming_msg_type,
-        incoming_msg_body,
-        message_id,
-        message_unix_time,
+    # NOTE: Passing the values as arguments (instead of using an f-string) means loguru only formats them
+    #   (e.g., repr-ing the message body dict) if the log record is actually emitted
+    logger.info("Received a supported whatsapp message from {}: {}", user_whatsapp_number, incoming_msg_body)
+
+    return ParsedWebhook(
+        is_status=is_status,
+        is_target_business_number=is_target_business_number,
+        user_whatsapp_number=user_whatsapp_number,
+        incoming_msg_type=incoming_msg_type,
+        incoming_msg_body=incoming_msg_body,
+        message_id=message_id,
+        message_unix_time=message_unix_time,
     )